@@ -2,10 +2,17 @@
 #   - class for ring of integers relative to a modulus
 
 #===========================================================
-from collections import Counter
 from functools import reduce
+from math import gcd
+from operator import mul
 
-from ..basic import gcd, mod_inverse, mod_power, prime_to
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ..basic import mod_inverse, mod_power, prime_to
+from ..config import default
 from ..factorization import factor
 from ..modular import carmichael_lambda, euler_phi, mod_sqrt
 #===========================================================
@@ -29,11 +36,14 @@ class ModularRing:
         else:
             self.orders = {1 : 1, modulus - 1 : 2}
             self.inverses = {1 : 1, modulus - 1 : modulus - 1}
+        self.sqrts = {}
 
         self._factorization = None
+        self._montgomery = None
         self._euler = None
         self._carmichael = None
         self._carmichael_factorization = None
+        self._is_cyclic = None
         self._multiplicative_group = None
         self._generator = None
         self._cyclic_group_dict = None
@@ -73,15 +83,16 @@ class ModularRing:
 
     #-------------------------
 
-    def carmichael_primes(self):
-        """Prime factors of maximum order.  Used for calculating orders."""
-        return Counter(self.carmichael_factorization()).elements()
-
-    #-------------------------
-
     def is_cyclic(self):
         """Determine if the multiplicative group is cyclic."""
-        return self.euler() == self.carmichael()
+        if self._is_cyclic is None:
+            if self.modulus in [1, 2, 4]:
+                self._is_cyclic = True
+            else:
+                factorization = self.factorization()
+                self._is_cyclic = factorization.get(2, 0) < 2 \
+                        and len([p for p in factorization if p != 2]) == 1
+        return self._is_cyclic
 
     #-------------------------
 
@@ -131,14 +142,38 @@ class ModularRing:
     def all_orders(self):
         """Compute orders of all elements of multiplicative group."""
         if len(self.orders) != self.euler():
-            if self.is_cyclic():
-                self.generator()
-            for x in self.multiplicative_group():
-                self.order_of(x)
+            if np is not None and self.modulus < 2**32:
+                self._all_orders_batched()
+            else:
+                if self.is_cyclic():
+                    self.generator()
+                for x in self.multiplicative_group():
+                    self.order_of(x)
         return self.orders
 
     #-------------------------
 
+    def _all_orders_batched(self):
+        """Compute all orders at once with vectorized square-and-multiply."""
+        modulus = self.modulus
+        carmichael = self.carmichael()
+        bases = np.array(self.multiplicative_group(), dtype=np.uint64)
+        orders = np.ones(len(bases), dtype=np.uint64)
+
+        for prime, exp in self.carmichael_factorization().items():
+            powers = _batched_mod_power(bases, carmichael // prime**exp, modulus)
+            for _ in range(exp):
+                remaining = powers != 1
+                if not remaining.any():
+                    break
+                orders[remaining] = orders[remaining] * np.uint64(prime)
+                powers[remaining] = _batched_mod_power(
+                    powers[remaining], prime, modulus)
+
+        self.orders = {int(x) : int(o) for x, o in zip(bases, orders)}
+
+    #-------------------------
+
     def all_inverses(self):
         """Compute inverses of all elements of multiplicative group."""
         if len(self.inverses) != self.euler():
@@ -152,7 +187,20 @@ class ModularRing:
 
     def all_generators(self):
         """Compute all generators of multiplicative group if cyclic."""
-        return [x for x, o in self.all_orders().items() if o == self.euler()]
+        if not self.is_cyclic():
+            return []
+
+        generator = self.generator()
+        euler = self.euler()
+        modulus = self.modulus
+        generators = []
+        power = generator
+        for exp in range(1, euler + 1):
+            if gcd(exp, euler) == 1:
+                generators.append(power)
+            power = power * generator % modulus
+
+        return sorted(generators)
 
     #=========================
 
@@ -170,27 +218,31 @@ class ModularRing:
 
     def add(self, *elements):
         """Add elements in modular ring."""
-        return reduce(
-            lambda x, y: (x + y) % self.modulus,
-            map(self.elem, elements),
-            0
-        )
+        return sum(elements) % self.modulus
 
     #-------------------------
 
     def mult(self, *elements):
         """Multiply elements in modular ring."""
-        return reduce(
-            lambda x, y: (x * y) % self.modulus,
-            map(self.elem, elements),
-            1
-        )
+        return reduce(mul, elements, 1) % self.modulus
 
     #-------------------------
 
     def power_of(self, element, exponent):
         """Compute power of element in modular ring."""
-        return mod_power(element, exponent, self.modulus)
+        if exponent < 0:
+            return mod_power(element, exponent, self.modulus)
+        if default('montgomery_exponentiation') and self.modulus & 1 \
+                and exponent.bit_length() > 8:
+            result = self._to_mont(1)
+            base = self._to_mont(self.elem(element))
+            while exponent:
+                if exponent & 1:
+                    result = self._mont_mul(result, base)
+                exponent >>= 1
+                base = self._mont_mul(base, base)
+            return self._from_mont(result)
+        return pow(element, exponent, self.modulus)
 
     #-------------------------
 
@@ -209,13 +261,18 @@ class ModularRing:
 
     def sqrt_of(self, element):
         """Compute square roots of element of multiplicative group if modulus is prime."""
-        if self._generator is not None:
-            index = self.log_of(element)
-            if index % 2 == 0:
-                sqrt = self.exp_of((index // 2))
-                return tuple(sorted([sqrt, self.neg(sqrt)]))
-        if self.is_field():
-            return mod_sqrt(element, self.modulus)
+        if element not in self.sqrts:
+            if self._generator is not None:
+                index = self.log_of(element)
+                if index % 2 == 0:
+                    sqrt = self.exp_of((index // 2))
+                    self.sqrts[element] = tuple(sorted([sqrt, self.neg(sqrt)]))
+                    return self.sqrts[element]
+            if self.is_field():
+                self.sqrts[element] = mod_sqrt(element, self.modulus)
+            else:
+                self.sqrts[element] = None
+        return self.sqrts[element]
 
     #-------------------------
 
@@ -237,32 +294,33 @@ class ModularRing:
             return self.orders[element]
 
         if self._generator is not None:
-            order = self.euler() // gcd(self.log_of(element), self.euler())
+            euler = self.euler()
+            order = euler // gcd(self.log_of(element), euler)
             self.orders[element] = order
             return order
 
         elem = self.elem(element)
-        powers = {1 : elem}
-        for p in self.carmichael_primes():
-            new_powers = {p*e : self.power_of(x, p) for e, x in powers.items() if p*e not in powers.keys()}
-            try:
-                order = min(e for e, x in new_powers.items() if x == 1)
-                self.orders[element] = order
-                return order
+        modulus = self.modulus
+        order = self.carmichael()
+        for prime in self.carmichael_factorization():
+            while order % prime == 0 and pow(elem, order // prime, modulus) == 1:
+                order //= prime
 
-            except ValueError:
-                powers = {**powers, **new_powers}
+        self.orders[element] = order
+        return order
 
     #-------------------------
 
     def cyclic_subgroup_from(self, element):
         """Compute subgroup generated by element of multiplicative group."""
+        modulus = self.modulus
+        elem = self.elem(element)
         subgroup = {0 : 1}
-        curr_elem = element
+        curr_elem = elem
         curr_power = 1
         while curr_elem != 1:
             subgroup[curr_power] = curr_elem
-            curr_elem = self.mult(curr_elem, element)
+            curr_elem = curr_elem * elem % modulus
             curr_power += 1
 
         if element not in self.orders:
@@ -270,3 +328,67 @@ class ModularRing:
 
         return subgroup
 
+    #=========================
+
+    def _montgomery_constants(self):
+        """Precompute REDC constants for repeated multiplication.  Requires odd modulus."""
+        if self._montgomery is None:
+            k = ((self.modulus.bit_length() + 63) // 64) * 64
+            r = 1 << k
+            self._montgomery = (
+                k,
+                r - 1,
+                (-pow(self.modulus, -1, r)) % r,
+                (r * r) % self.modulus
+            )
+        return self._montgomery
+
+    #-------------------------
+
+    def _redc(self, t):
+        """Montgomery reduction of `t` by one factor of the radix."""
+        k, r_mask, m_inv, _ = self._montgomery_constants()
+        reduced = (t + (((t & r_mask) * m_inv) & r_mask) * self.modulus) >> k
+        if reduced >= self.modulus:
+            reduced -= self.modulus
+        return reduced
+
+    #-------------------------
+
+    def _to_mont(self, element):
+        """Convert element to Montgomery form."""
+        return self._redc(element * self._montgomery_constants()[3])
+
+    #-------------------------
+
+    def _from_mont(self, element):
+        """Convert element out of Montgomery form."""
+        return self._redc(element)
+
+    #-------------------------
+
+    def _mont_mul(self, element, other):
+        """Multiply two elements of the ring in Montgomery form."""
+        return self._redc(element * other)
+
+#=============================
+
+def _batched_mod_power(bases, exponent, modulus):
+    """
+    Square-and-multiply on an array of bases simultaneously.
+
+    + bases: np.ndarray --dtype uint64, entries in range(modulus)
+    + exponent: int --at least 0
+    + modulus: int --less than 2**32, so products stay within uint64
+    ~> np.ndarray
+    """
+    result = np.ones_like(bases)
+    bases = bases.copy()
+    while exponent:
+        if exponent & 1:
+            result = result * bases % modulus
+        exponent >>= 1
+        bases = bases * bases % modulus
+
+    return result
+
@@ -27,8 +27,7 @@ def div(a, b):
     + b: int --nonzero
     ~> (quotient, remainder): Tuple[int, int]
     """
-    quotient = a // b
-    remainder = a % b
+    quotient, remainder = divmod(a, b)
     if b < 0 and remainder != 0:
         quotient += 1
         remainder -= b
@@ -71,19 +70,9 @@ def gcd(*numbers):
     + numbers: Iterable[int] --not all zero
     ~> int
     """
-    if 0 in numbers:
-        return gcd(*filter(lambda x: x != 0, numbers))
-
-    if len(numbers) == 0:
+    if not any(numbers):
         raise ValueError('gcd(0, 0) is undefined')
 
-    if len(numbers) == 1:
-        return abs(*numbers)
-
-    if len(numbers) > 2:
-        first, *rest = numbers
-        return gcd(first, gcd(*rest))
-
     return math.gcd(*numbers)
 
 #-----------------------------
@@ -99,15 +88,10 @@ def lcm(*numbers):
     + numbers: Iterable[int] --not all zero
     ~> int
     """
-    if len(numbers) == 1:
-        return abs(*numbers)
+    if not any(numbers):
+        raise ValueError('lcm(0, 0) is undefined')
 
-    if len(numbers) > 2:
-        first, *rest = numbers
-        return lcm(first, lcm(*rest))
-
-    a, b = numbers
-    return abs(a // gcd(a, b) * b)
+    return math.lcm(*numbers)
 
 #=============================
 
@@ -133,12 +117,12 @@ def bezout(a, b):
     def advance(u, v, q):
         return v, u - q * v
 
-    q, r = div(a, b)
+    q, r = divmod(a, b)
     X = (0, 1)
     Y = (1, -q)
     while r != 0:
         a, b, = b, r
-        q, r = div(a, b)
+        q, r = divmod(a, b)
         X, Y = advance(*X, q), advance(*Y, q)
 
     return X[0], Y[0]
@@ -164,6 +148,10 @@ def padic(number, base):
     if base < 2:
         raise ValueError('base must be at least 2')
 
+    if base == 2:
+        exp = (number & -number).bit_length() - 1
+        return exp, number >> exp
+
     exp = 0
     unit = number
     while unit % base == 0:
@@ -5,7 +5,7 @@
 from functools import reduce
 import itertools as it
 
-from .division import bezout, gcd, padic
+from ..config import default
 #===========================================================
 __all__ = [
     'jacobi',
@@ -27,24 +27,19 @@ def jacobi(a, b):
     """
     if b % 2 == 0:
         raise ValueError('jacobi(_, even) is undefined')
-    if b == 1:
-        return 1
-    if gcd(a, b) != 1:
-        return 0
 
+    a = a % b
     sign = 1
-    sign_change = [
-        (0, 3, 3), (0, 3, 7),
-        (1, 1, 3), (1, 1, 5),
-        (1, 3, 5), (1, 3, 7)
-    ]
-    while b != 1:
-        e, r = padic(a % b, 2)
-        if (e % 2, r % 4, b % 8) in sign_change:
-            sign *= -1
-        a, b = b, r
-
-    return sign
+    while a != 0:
+        two_adic = (a & -a).bit_length() - 1
+        a >>= two_adic
+        if two_adic & 1 and b & 7 in [3, 5]:
+            sign = -sign
+        if a & 3 == 3 == b & 3:
+            sign = -sign
+        a, b = b % a, a
+
+    return sign if b == 1 else 0
 
 #-----------------------------
 
@@ -84,16 +79,11 @@ def mod_inverse(number, modulus):
     if modulus < 2:
         raise ValueError('modulus must be at least 2')
 
-    inverse = bezout(number, modulus)[0]
-
-    if (number * inverse) % modulus not in [1, -1]:
+    try:
+        return pow(number, -1, modulus)
+    except ValueError:
         raise ValueError('{} not invertible modulo {}'.format(number, modulus))
 
-    if inverse < 0:
-        inverse += modulus
-
-    return inverse
-
 #-----------------------------
 
 def mod_power(number, exponent, modulus):
@@ -114,8 +104,64 @@ def mod_power(number, exponent, modulus):
     if exponent < 0:
         return pow(mod_inverse(number, modulus), -exponent, modulus)
 
+    if default('montgomery_exponentiation') and modulus & 1 \
+            and exponent.bit_length() > 8:
+        return _mont_pow(number % modulus, exponent, modulus)
+
     return pow(number, exponent, modulus)
 
+#-----------------------------
+
+def _mont_pow(number, exponent, modulus, window=4):
+    """
+    Sliding-window square-and-multiply in Montgomery form for odd `modulus`.
+
+    Each step reduces with a REDC (multiply, mask, shift) instead of
+    dividing by the modulus, and odd powers of the base up to
+    `2**window - 1` are precomputed so each nonzero window of exponent
+    bits costs a single multiply.
+
+    + number: int --in range(modulus)
+    + exponent: int --at least 0
+    + modulus: int --odd, at least 3
+    + window: int --at least 1
+    ~> int
+    """
+    k = ((modulus.bit_length() + 63) // 64) * 64
+    r_mask = (1 << k) - 1
+    m_inv = (-pow(modulus, -1, 1 << k)) & r_mask
+
+    def redc(t):
+        reduced = (t + (((t & r_mask) * m_inv) & r_mask) * modulus) >> k
+        if reduced >= modulus:
+            reduced -= modulus
+        return reduced
+
+    base = (number << k) % modulus
+    base_sqr = redc(base * base)
+    odd_powers = [base]
+    for _ in range(2**(window - 1) - 1):
+        odd_powers.append(redc(odd_powers[-1] * base_sqr))
+
+    result = (1 << k) % modulus
+    i = exponent.bit_length() - 1
+    while i >= 0:
+        if not (exponent >> i) & 1:
+            result = redc(result * result)
+            i -= 1
+            continue
+
+        j = max(i - window + 1, 0)
+        while not (exponent >> j) & 1:
+            j += 1
+        window_bits = (exponent >> j) & ((1 << (i - j + 1)) - 1)
+        for _ in range(i - j + 1):
+            result = redc(result * result)
+        result = redc(result * odd_powers[window_bits >> 1])
+        i = j - 1
+
+    return redc(result)
+
 #=============================
 
 def chinese_remainder_theorem(residues, moduli):
@@ -21,7 +21,7 @@ def integer_sqrt(number, guess=None):
     ~> int
     """
     if guess is None:
-        guess = int(math.sqrt(number))
+        return math.isqrt(number)
 
     while guess**2 > number or (guess+1)**2 <= number:
         guess = (guess + number // guess) // 2
@@ -41,5 +41,5 @@ def is_square(number):
     + number: int
     ~> bool
     """
-    return number >= 0 and integer_sqrt(number)**2 == number
+    return number >= 0 and math.isqrt(number)**2 == number
 
@@ -10,7 +10,8 @@ DEFAULTS = {
     'prime_base_max': 1000,
     'miller_rabin_witness_count': 40,
     'lucas_witness_pair_count': 10,
-    'sieve_primes': [2, 3, 5, 7]
+    'sieve_primes': [2, 3, 5, 7],
+    'montgomery_exponentiation': False
 }
 
 def default(category):
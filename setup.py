@@ -26,6 +26,7 @@ setup(
     ],
     packages = ['ebe'],
     install_requires = ['pytest', 'hypothesis'],
+    extras_require = {'batched': ['numpy']},
     python_requires = '>=3',
 )
 
@@ -1,8 +1,10 @@
 #   tests/algebraic_structures_test.py
 #===========================================================
 import env
+import pytest
 from hypothesis import given, strategies as st
 
+from lib import config
 from lib.basic import gcd, jacobi, mod_power
 from lib.primality import is_prime
 from lib.algebraic_structures import *
@@ -93,3 +95,47 @@ def test_modular_ring(modulus, a, b, c):
                     assert Zm.power_of(y, 2) == x
                     assert Zm.log_of(x) == (Zm.log_of(y) * 2) % (Zm.euler())
 
+#-----------------------------
+
+@given(
+    st.integers(min_value=3, max_value=2**64).filter(lambda x: x % 2 == 1),
+    st.integers(),
+    st.integers(min_value=2**8 + 1, max_value=2**64)
+)
+def test_power_of_montgomery_flag(modulus, element, exponent):
+    Zm = ModularRing(modulus)
+    config.DEFAULTS['montgomery_exponentiation'] = True
+    try:
+        assert Zm.power_of(element, exponent) == pow(element, exponent, modulus)
+    finally:
+        config.DEFAULTS['montgomery_exponentiation'] = False
+
+#-----------------------------
+
+def test_all_orders_batched_agrees_with_scalar():
+    pytest.importorskip('numpy')
+    for modulus in [*range(2, 120), 360, 561]:
+        batched = ModularRing(modulus)
+        batched._all_orders_batched()
+
+        scalar = ModularRing(modulus)
+        if scalar.is_cyclic():
+            scalar.generator()
+        for x in scalar.multiplicative_group():
+            scalar.order_of(x)
+
+        assert batched.orders == scalar.orders
+
+#-----------------------------
+
+def test_batched_mod_power_near_uint64_bound():
+    np = pytest.importorskip('numpy')
+    from lib.algebraic_structures.modular_ring import _batched_mod_power
+
+    modulus = 2**32 - 5
+    bases = np.array([1, 2, 3, modulus - 2, modulus - 1], dtype=np.uint64)
+    for exponent in [1, 2, 257, modulus - 1, modulus]:
+        result = _batched_mod_power(bases, exponent, modulus)
+        assert [int(x) for x in result] \
+                == [pow(int(b), exponent, modulus) for b in bases]
+
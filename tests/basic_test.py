@@ -4,9 +4,11 @@ from hypothesis import assume, given, strategies as st
 from random import sample
 
 import env
+from lib import config
 from lib.factorization import factor
 from lib.modular import euler_phi
 from lib.basic import *
+from lib.basic.modular import _mont_pow
 #===========================================================
 #   division
 #===========================================================
@@ -142,6 +144,30 @@ def test_mod_power(number, exponent, modulus):
 
 #-----------------------------
 
+@given(
+    number = st.integers(min_value=0),
+    exponent = st.integers(min_value=2**8 + 1, max_value=2**64),
+    modulus = st.integers(min_value=3, max_value=2**256).filter(lambda x: x % 2 == 1)
+)
+def test_mont_pow(number, exponent, modulus):
+    assert( _mont_pow(number % modulus, exponent, modulus) == pow(number, exponent, modulus) )
+
+#-----------------------------
+
+@given(
+    number = st.integers(),
+    exponent = st.integers(min_value=2**8 + 1, max_value=2**64),
+    modulus = st.integers(min_value=3, max_value=2**256).filter(lambda x: x % 2 == 1)
+)
+def test_mod_power_montgomery_flag(number, exponent, modulus):
+    config.DEFAULTS['montgomery_exponentiation'] = True
+    try:
+        assert( mod_power(number, exponent, modulus) == pow(number, exponent, modulus) )
+    finally:
+        config.DEFAULTS['montgomery_exponentiation'] = False
+
+#-----------------------------
+
 @given(*(3 * [st.integers()]))
 def test_chinese_remainder_theorem(a, b, c):
     primes = sample(primes_up_to(10**3), 4)